@@ -22,7 +22,7 @@ def lossfit(entity):
 def get_lossy_features(row):
     features = []
     col_lossy = None
-    for col, val in row.iteritems():
+    for col, val in row.items():
         if np.isnan(val):
             if col_lossy is None:
                 col_lossy = col
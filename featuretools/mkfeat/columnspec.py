@@ -1,17 +1,21 @@
-import pandas as pd
+from functools import cached_property
 
-from .error import Error
+import numpy as np
 
+from .error import Error
 
-_mkfeat_typestr_to_converter = {
-    "number": pd.to_numeric,
-    "date": pd.to_datetime
-}
 
+# number는 converter가 아닌 dtype으로 처리. converter는 cell단위 python 호출이어서 대용량 CSV에서 매우 느림.
+# date는 read후 컬럼 단위로 일괄 변환함 (QufaCsv 참조)
 _mkfeat_typestr_to_dtype = {
-    "bool": bool
+    "bool": bool,
+    "number": float,
+    "string": 'category',
+    "class": 'category'
 }
 
+_mkfeat_numeric_typestrs = frozenset(("number", "bool"))
+
 
 class ColumnSpec:
     """
@@ -20,6 +24,21 @@ class ColumnSpec:
     def __init__(self, columns):
         self.columns = columns
         self._auto_keyname = None
+        self._usecols_cache = {}
+        # 컬럼별 정보를 병렬 배열(SoA)로 미리 구성. 컬럼수가 많은 경우 getter들의 dict 탐색 비용 제거 목적
+        n_columns = len(columns)
+        self._names = np.array([colinfo.get('name') for colinfo in columns], dtype=object)
+        self._types = np.array([colinfo.get('type') for colinfo in columns], dtype=object)
+        self._is_key = np.fromiter((bool(colinfo.get('key')) for colinfo in columns),
+                                   dtype=bool, count=n_columns)
+        self._is_label = np.fromiter((bool(colinfo.get('label')) for colinfo in columns),
+                                     dtype=bool, count=n_columns)
+        self._is_train = np.fromiter((bool(colinfo.get('train')) for colinfo in columns),
+                                     dtype=bool, count=n_columns)
+        self._is_bypass = np.fromiter((bool(colinfo.get('bypass')) for colinfo in columns),
+                                      dtype=bool, count=n_columns)
+        self._is_numeric = np.fromiter((self._is_numeric_type(typestr) for typestr in self._types),
+                                       dtype=bool, count=n_columns)
 
     def validate(self):
         """
@@ -28,24 +47,14 @@ class ColumnSpec:
         Returns:
             :class:.Error: column 정의가 문제 없는 경우 OK반환. 그렇지 않으면 해당하는 오류값 반환.
         """
-        has_key = False
-        has_label = False
-        for colinfo in self.columns:
-            if 'name' not in colinfo or 'type' not in colinfo:
-                return Error.ERR_COLUMN_HAS_NO_NAME_OR_TYPE
-            if 'key' in colinfo:
-                if colinfo['key']:
-                    if has_key:
-                        return Error.ERR_COLUMN_MULTI_KEY
-                    if 'label' in colinfo and colinfo['label']:
-                        return Error.ERR_COLUMN_KEY_AND_LABEL
-                    has_key = True
-            if 'label' in colinfo:
-                if colinfo['label']:
-                    if has_label:
-                        return Error.ERR_COLUMN_MULTI_LABEL
-                    has_label = True
-        return Error.OK
+        failures = (
+            (((self._names == None) | (self._types == None)).any(),  # noqa: E711
+             Error.ERR_COLUMN_HAS_NO_NAME_OR_TYPE),
+            (self._is_key.sum() > 1, Error.ERR_COLUMN_MULTI_KEY),
+            ((self._is_key & self._is_label).any(), Error.ERR_COLUMN_KEY_AND_LABEL),
+            (self._is_label.sum() > 1, Error.ERR_COLUMN_MULTI_LABEL),
+        )
+        return next((error for failed, error in failures if failed), Error.OK)
 
     def get_colnames(self):
         """
@@ -54,10 +63,7 @@ class ColumnSpec:
         Returns:
             컬럼명으로 구성된 배열
         """
-        colnames = []
-        for colinfo in self.columns:
-            colnames.append(colinfo['name'])
-        return colnames
+        return self._names
 
     def get_usecols(self, numeric_only: bool = False, label_only: bool = False, exclude_skip: bool = False):
         """
@@ -70,34 +76,49 @@ class ColumnSpec:
         Returns:
             컬럼명으로 구성된 배열
         """
-        colnames = []
-        for colinfo in self.columns:
-            if numeric_only and not self._is_numeric_type(colinfo['type']):
-                continue
-            if label_only and ('label' not in colinfo or not colinfo['label']):
-                continue
-            if exclude_skip and (('label' in colinfo and colinfo['label']) or
-                                 ('train' in colinfo and colinfo['train']) or
-                                 ('bypass' in colinfo and colinfo['bypass'])):
-                continue
-            colnames.append(colinfo['name'])
-        return colnames
+        cache_key = (numeric_only, label_only, exclude_skip)
+        if cache_key not in self._usecols_cache:
+            mask = np.ones(len(self._names), dtype=bool)
+            if numeric_only:
+                mask &= self._is_numeric
+            if label_only:
+                mask &= self._is_label
+            if exclude_skip:
+                mask &= ~(self._is_label | self._is_train | self._is_bypass)
+            self._usecols_cache[cache_key] = self._names[mask]
+        return self._usecols_cache[cache_key]
+
+    @cached_property
+    def _dtypes(self):
+        # key 컬럼은 모든 값이 고유하므로 categorical로 변환 시 이득이 없음
+        return {name: (object if is_key and _mkfeat_typestr_to_dtype[typestr] == 'category'
+                       else _mkfeat_typestr_to_dtype[typestr])
+                for name, typestr, is_key in zip(self._names, self._types, self._is_key)
+                if typestr in _mkfeat_typestr_to_dtype}
 
     def get_dtypes(self):
-        dtypes = {}
-        for colinfo in self.columns:
-            dtype = self._get_dtype_from_strtype(colinfo['type'])
-            if dtype is not None:
-                dtypes[colinfo['name']] = dtype
-        return dtypes
-
-    def get_converters(self):
-        converters = {}
-        for colinfo in self.columns:
-            converter = self._get_converter_from_strtype(colinfo['type'])
-            if converter is not None:
-                converters[colinfo['name']] = converter
-        return converters
+        return self._dtypes
+
+    @cached_property
+    def _datetime_colnames(self):
+        return self._names[self._types == 'date']
+
+    def get_datetime_colnames(self):
+        """
+        date 형식 컬럼명 배열을 반환. CSV read후 일괄 datetime 변환 대상을 구하기 위함
+
+        Returns:
+            컬럼명으로 구성된 배열
+        """
+        return self._datetime_colnames
+
+    @cached_property
+    def _key_colname(self):
+        key_idxes = np.flatnonzero(self._is_key)
+        if key_idxes.size > 0:
+            return self._names[key_idxes[0]]
+        self._setup_auto_keyname()
+        return self._auto_keyname
 
     def get_key_colname(self):
         """
@@ -106,33 +127,41 @@ class ColumnSpec:
         Returns:
             key column name which can be used as row identifer.
         """
-        for colinfo in self.columns:
-            if 'key' in colinfo and colinfo['key']:
-                return colinfo['name']
-        self._setup_auto_keyname()
-        return self._auto_keyname
+        return self._key_colname
 
     def is_auto_keyname(self):
         return True if self._auto_keyname else False
 
+    @cached_property
+    def _label_colname(self):
+        label_idxes = np.flatnonzero(self._is_label)
+        if label_idxes.size > 0:
+            return self._names[label_idxes[0]]
+        return None
+
     def get_label_colname(self):
-        for colinfo in self.columns:
-            if 'label' in colinfo and colinfo['label']:
-                return colinfo['name']
+        return self._label_colname
+
+    @cached_property
+    def _train_colname(self):
+        train_idxes = np.flatnonzero(self._is_train)
+        if train_idxes.size > 0:
+            return self._names[train_idxes[0]]
         return None
 
     def get_train_colname(self):
-        for colinfo in self.columns:
-            if 'train' in colinfo and colinfo['train']:
-                return colinfo['name']
-        return None
+        return self._train_colname
+
+    @cached_property
+    def _bypass_colnames(self):
+        return self._names[self._is_bypass]
 
     def get_bypass_colnames(self):
-        colnames = []
-        for colinfo in self.columns:
-            if 'bypass' in colinfo and colinfo['bypass']:
-                colnames.append(colinfo['name'])
-        return colnames
+        return self._bypass_colnames
+
+    @cached_property
+    def _is_numerics(self):
+        return self._is_numeric & ~(self._is_label | self._is_bypass)
 
     def get_is_numerics(self):
         """
@@ -140,34 +169,16 @@ class ColumnSpec:
         Returns:
 
         """
-        is_numerics = []
-        for colinfo in self.columns:
-            if 'label' in colinfo and colinfo['label'] or 'bypass' in colinfo and colinfo['bypass']:
-                is_numerics.append(False)
-            else:
-                is_numerics.append(self._is_numeric_type(colinfo['type']))
-        return is_numerics
-
-    @staticmethod
-    def _get_dtype_from_strtype(typestr):
-        if typestr in _mkfeat_typestr_to_dtype:
-            return _mkfeat_typestr_to_dtype[typestr]
-        return None
-
-    @staticmethod
-    def _get_converter_from_strtype(typestr):
-        if typestr in _mkfeat_typestr_to_converter:
-            return _mkfeat_typestr_to_converter[typestr]
-        return None
+        return self._is_numerics
 
     @staticmethod
-    def _is_numeric_type(self):
-        return self in ('number', 'bool')
+    def _is_numeric_type(typestr):
+        return typestr in _mkfeat_numeric_typestrs
 
     def _setup_auto_keyname(self):
         if self._auto_keyname:
             return
-        colnames = self.get_colnames()
+        colnames = set(self.get_colnames())
         if 'id' not in colnames:
             keyname = 'id'
         else:
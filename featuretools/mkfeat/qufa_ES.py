@@ -38,12 +38,10 @@ class QufaES(EntitySet):
             data.drop(columns=colname_train, inplace=True)
             self._df_train.set_index(colname_key, inplace=True)
 
-        colnames_bypass = colspec.get_bypass_colnames()
+        colnames_bypass = list(colspec.get_bypass_colnames())
         if colnames_bypass:
-            colnames_bypass.insert(0, colname_key)
-            self._df_bypass = data[colnames_bypass]
+            self._df_bypass = data[[colname_key] + colnames_bypass]
             self._df_bypass.set_index(colname_key, inplace=True)
-            colnames_bypass.remove(colname_key)
             data = data.drop(columns=colnames_bypass)
 
         try:
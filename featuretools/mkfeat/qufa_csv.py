@@ -31,12 +31,20 @@ class QufaCsv:
 
         n_total_rows = self.get_n_rows()
 
+        # category는 chunk별로 적용하면 chunk간 category 집합이 달라 concat 시 object로 복귀하므로
+        # object로 읽고 concat 후 일괄 변환
+        dtypes = self._colspec.get_dtypes()
+        category_colnames = [name for name, dtype in dtypes.items() if dtype == 'category']
+        if category_colnames:
+            dtypes = {name: (object if dtype == 'category' else dtype)
+                      for name, dtype in dtypes.items()}
+
         try:
             chunk_size = 10000
             n_rows = 0
             chunks = []
-            for chunk in pd.read_csv(self._path, header=None, names=colnames, converters=self._colspec.get_converters(),
-                                     skiprows=self._skiprows, usecols=usecols, dtype=self._colspec.get_dtypes(),
+            for chunk in pd.read_csv(self._path, header=None, names=colnames,
+                                     skiprows=self._skiprows, usecols=usecols, dtype=dtypes,
                                      true_values=['Y', 'true', 'T'], false_values=['N', 'false', 'F'],
                                      chunksize=chunk_size):
                 chunks.append(chunk)
@@ -45,10 +53,25 @@ class QufaCsv:
                 if callback is not None:
                     callback(prog, ProgressPhase.READ_CSV)
 
-            return pd.concat(chunks)
+            data = pd.concat(chunks)
+            for colname in category_colnames:
+                if colname in data.columns:
+                    data[colname] = data[colname].astype('category')
+            self._convert_datetime_columns(data)
+            return data
         except ValueError:
             return Error.ERR_COLUMN_TYPE
 
+    def _convert_datetime_columns(self, data):
+        # date 컬럼은 converter(cell단위 호출)가 아닌 컬럼 단위로 일괄 변환. unix epoch 형태의 숫자 컬럼도 지원함
+        for colname in self._colspec.get_datetime_colnames():
+            if colname not in data.columns:
+                continue
+            if pd.api.types.is_numeric_dtype(data[colname]):
+                data[colname] = pd.to_datetime(data[colname], unit='s')
+            else:
+                data[colname] = pd.to_datetime(data[colname])
+
     def _guess_n_columns(self):
         data = pd.read_csv(self._path, header=0, skiprows=self._skiprows, nrows=1)
         return len(data.columns)
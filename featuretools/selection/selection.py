@@ -1,5 +1,16 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
 from featuretools import variable_types as vtypes
 
+# tile size for the blocked correlation matmul, sized to fit in L2 cache
+_CORR_TILE_BYTES = 1 << 20
+
+# minimum number of matrix elements before threading the matmul pays off
+_CORR_PARALLEL_MIN_ELEMENTS = 1 << 22
+
 
 def remove_low_information_features(feature_matrix, features=None):
     """Select features that have at least 2 unique values and that are not all null
@@ -12,9 +23,10 @@ def remove_low_information_features(feature_matrix, features=None):
             (feature_matrix, features)
 
     """
-    keep = [c for c in feature_matrix
-            if (feature_matrix[c].nunique(dropna=False) > 1 and
-                feature_matrix[c].dropna().shape[0] > 0)]
+    # a column with more than one unique value (counting null as a value)
+    # necessarily has at least one non-null value, so the null check is covered
+    # by the same unique counts used by remove_single_value_features
+    keep = _multi_value_columns(feature_matrix, dropna=False)
     feature_matrix = feature_matrix[keep]
     if features is not None:
         features = [f for f in features
@@ -42,7 +54,12 @@ def remove_highly_null_features(feature_matrix, features=None, pct_null_threshol
     if pct_null_threshold < 0 or pct_null_threshold > 1:
         raise ValueError("pct_null_threshold must be a float between 0 and 1, inclusive.")
 
-    percent_null_by_col = (feature_matrix.isnull().mean()).to_dict()
+    null_counts = feature_matrix.isna().sum()
+    if not null_counts.to_numpy().any():
+        # dense frame: no column can cross the threshold, so keep everything
+        return _apply_feature_selection(list(feature_matrix.columns), feature_matrix, features)
+
+    percent_null_by_col = (null_counts / len(feature_matrix)).to_dict()
 
     if pct_null_threshold == 0.0:
         keep = [f_name for f_name, pct_null in percent_null_by_col.items()
@@ -70,10 +87,7 @@ def remove_single_value_features(feature_matrix, features=None, count_nan_as_val
                 Matches dfs output.
                 If no feature list is provided as input, the feature list will not be returned.
     """
-    unique_counts_by_col = feature_matrix.nunique(dropna=not count_nan_as_value).to_dict()
-
-    keep = [f_name for f_name, unique_count
-            in unique_counts_by_col.items() if unique_count > 1]
+    keep = _multi_value_columns(feature_matrix, dropna=not count_nan_as_value)
     return _apply_feature_selection(keep, feature_matrix, features)
 
 
@@ -87,6 +101,13 @@ def remove_highly_correlated_features(feature_matrix, features=None, pct_corr_th
             The assumption does not hold if the order of columns in the feature
             matrix has changed from what ``dfs`` produces.
 
+        Note:
+            Null values are filled with the mean of their column before
+            correlations are computed, rather than excluding the affected rows
+            pairwise the way ``pd.DataFrame.corr`` does. For columns with
+            nulls, the computed correlations — and therefore which features
+            are removed — can differ from the pairwise-complete results.
+
         Args:
             feature_matrix (:class:`pd.DataFrame`): DataFrame whose columns are feature
                         names and rows are instances.
@@ -127,28 +148,103 @@ def remove_highly_correlated_features(feature_matrix, features=None, pct_corr_th
     fm_to_check = (feature_matrix[features_to_check]).select_dtypes(
         include=numeric_and_boolean_dtypes)
 
-    dropped = set()
-    columns_to_check = fm_to_check.columns
+    # a constant or all-null column can never exceed the threshold, so drop it
+    # from the check before paying for the full correlation matrix
+    stds = fm_to_check.std()
+    fm_to_check = fm_to_check.loc[:, (stds > 0).to_numpy()]
+
     # When two features are found to be highly correlated,
     # we drop the more complex feature
     # Columns produced later in dfs are more complex
-    for i in range(len(columns_to_check) - 1, 0, -1):
-        more_complex_name = columns_to_check[i]
-        more_complex_col = fm_to_check[more_complex_name]
-
-        for j in range(i - 1, -1, -1):
-            less_complex_name = columns_to_check[j]
-            less_complex_col = fm_to_check[less_complex_name]
-
-            if abs(more_complex_col.corr(less_complex_col)) >= pct_corr_threshold:
-                dropped.add(more_complex_name)
-                break
+    columns_to_check = fm_to_check.columns.to_numpy()
+    if columns_to_check.size == 0:
+        return _apply_feature_selection(list(feature_matrix.columns), feature_matrix, features)
+
+    corr_matrix = _corr_matrix(fm_to_check)
+    # the upper triangle yields each pair exactly once with i < j, so no
+    # normalization or dedup of pairs is needed and j is always the column
+    # produced later by dfs
+    i, j = np.triu_indices(len(columns_to_check), k=1)
+    highly_correlated = np.abs(corr_matrix[i, j]) >= pct_corr_threshold
+    dropped = set(columns_to_check[j[highly_correlated]])
 
     keep = [f_name for f_name in feature_matrix.columns
             if (f_name in features_to_keep or f_name not in dropped)]
     return _apply_feature_selection(keep, feature_matrix, features)
 
 
+def _multi_value_columns(feature_matrix, dropna):
+    """Names of columns with more than one unique value, in column order.
+
+    Single entry point for the unique-value scan shared by
+    remove_low_information_features and remove_single_value_features, so the
+    counts are computed in one vectorized pass. When nulls count as values,
+    all-null columns are filtered out with a cheap notna scan first to skip
+    the more expensive nunique over them.
+    """
+    if dropna:
+        unique_counts = feature_matrix.nunique(dropna=True)
+    else:
+        notna_counts = feature_matrix.notna().sum()
+        candidates = notna_counts[notna_counts > 0].index
+        unique_counts = feature_matrix[candidates].nunique(dropna=False)
+    return unique_counts[unique_counts > 1].index.tolist()
+
+
+def _corr_matrix(fm_to_check):
+    """Compute the correlation matrix of a numeric/boolean feature matrix.
+
+    The columns are stacked into a single contiguous float32 array, z-scored,
+    and multiplied in one BLAS call, which is much faster than computing each
+    pairwise correlation separately. float32 is the narrowest dtype with a
+    BLAS matmul kernel, so it is as low as the precision can usefully go.
+    Null values are replaced by the column mean so they do not contribute to
+    the covariance. Constant columns get a correlation of 0 with every other
+    column (pandas would report NaN); either way they are never treated as
+    highly correlated.
+    """
+    X = fm_to_check.to_numpy(dtype=np.float32)
+    n_rows, n_cols = X.shape
+    if n_rows == 0 or n_cols == 0:
+        return np.zeros((n_cols, n_cols), dtype=np.float32)
+    nan_mask = np.isnan(X)
+    if nan_mask.any():
+        filled = np.where(nan_mask, 0.0, X)
+        notna_counts = np.maximum((~nan_mask).sum(axis=0), 1)
+        means = filled.sum(axis=0) / notna_counts
+        X = np.where(nan_mask, means, X)
+    X = X - X.mean(axis=0)
+    std = X.std(axis=0)
+    std[std == 0] = 1
+    X /= std
+
+    # accumulate the Gram matrix over row tiles so each multiply works on a
+    # slice of X small enough to stay cache-resident for tall matrices; for
+    # large matrices, distribute disjoint column blocks over a thread pool
+    # (the matmuls release the GIL inside BLAS)
+    rows_per_tile = max(1, _CORR_TILE_BYTES // (X.itemsize * n_cols))
+    gram = np.zeros((n_cols, n_cols), dtype=np.float32)
+
+    def fill_columns(start_col):
+        stop_col = min(start_col + cols_per_block, n_cols)
+        block = np.zeros((n_cols, stop_col - start_col), dtype=np.float32)
+        for start_row in range(0, n_rows, rows_per_tile):
+            tile = X[start_row:start_row + rows_per_tile]
+            block += tile.T @ tile[:, start_col:stop_col]
+        gram[:, start_col:stop_col] = block
+
+    n_workers = min(os.cpu_count() or 1, n_cols)
+    if n_workers > 1 and X.size >= _CORR_PARALLEL_MIN_ELEMENTS:
+        cols_per_block = -(-n_cols // n_workers)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(fill_columns, range(0, n_cols, cols_per_block)))
+    else:
+        cols_per_block = n_cols
+        fill_columns(0)
+    gram /= n_rows
+    return gram
+
+
 def _apply_feature_selection(keep, feature_matrix, features=None):
     new_matrix = feature_matrix[keep]
     new_feature_names = set(new_matrix.columns)
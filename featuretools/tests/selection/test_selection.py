@@ -172,6 +172,20 @@ def test_remove_highly_correlated_features():
     assert 'diff_ints' in diff_threshold_cols
 
 
+def test_remove_highly_correlated_features_nothing_to_check():
+    all_categorical = pd.DataFrame({'id': [0, 1, 2], 'quarter': ['a', 'b', 'c'], 'vals': ['x', 'x', 'y']})
+    new_fm = ft.selection.remove_highly_correlated_features(all_categorical[['quarter', 'vals']])
+    assert list(new_fm.columns) == ['quarter', 'vals']
+
+    all_constant = pd.DataFrame({'const_1': [7, 7, 7], 'const_2': [1.5, 1.5, 1.5]})
+    new_fm = ft.selection.remove_highly_correlated_features(all_constant)
+    assert list(new_fm.columns) == ['const_1', 'const_2']
+
+    no_rows = pd.DataFrame({'num_1': pd.Series(dtype=float), 'num_2': pd.Series(dtype=float)})
+    new_fm = ft.selection.remove_highly_correlated_features(no_rows)
+    assert list(new_fm.columns) == ['num_1', 'num_2']
+
+
 def test_multi_output_selection():
     df1 = pd.DataFrame({'id': [0, 1, 2, 3]})
 